@@ -0,0 +1,111 @@
+"""
+Persistent on-disk cache of generated chunk terrain
+"""
+import hashlib
+import os
+import queue
+import shelve
+import threading
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from eartheater.constants import CHUNK_SIZE, MaterialType
+
+# Bump whenever chunk generation or the stored block format changes, so
+# entries written by older versions are never loaded
+CACHE_FORMAT_VERSION = 2
+
+
+def generation_id(settings) -> str:
+    """Identify the terrain produced by a set of world generation settings
+
+    Hashes every setting except the cache directory, together with the cache
+    format version, the chunk size and the stored MaterialType values, so
+    changing any of them starts a fresh set of cache entries.
+
+    Args:
+        settings: WorldGenSettings the chunks are generated with
+
+    Returns:
+        Short string to pass to WorldCache.load and WorldCache.store
+    """
+    fields = sorted((name, value) for name, value in vars(settings).items()
+                    if name != 'chunk_cache_dir')
+    materials = sorted((material.name, material.value) for material in MaterialType)
+    digest = hashlib.sha1(repr((CHUNK_SIZE, fields, materials)).encode()).hexdigest()
+    return f"v{CACHE_FORMAT_VERSION}-{digest[:16]}"
+
+
+class WorldCache:
+    """Stores generated chunk blocks on disk, keyed by (generation id, chunk_x, chunk_y)
+
+    Revisiting a chunk in a later session reads and decompresses its bytes
+    instead of running terrain generation again. Writes are handed to a
+    background thread so generation never waits on the disk.
+    """
+    def __init__(self, cache_dir: str):
+        """Open (or create) the cache in the given directory"""
+        os.makedirs(cache_dir, exist_ok=True)
+        self._db = shelve.open(os.path.join(cache_dir, "chunks"))
+        self._db_lock = threading.Lock()  # shelve is not safe across threads
+
+        self._writes: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    @staticmethod
+    def _key(generation: str, chunk_x: int, chunk_y: int) -> str:
+        """Build the storage key for a chunk"""
+        return f"{generation}:{chunk_x}:{chunk_y}"
+
+    def load(self, generation: str, chunk_x: int, chunk_y: int) -> Optional[np.ndarray]:
+        """Read a chunk's blocks from the cache
+
+        Args:
+            generation: Settings the chunk was generated with, see generation_id()
+            chunk_x: Chunk x coordinate in chunk space
+            chunk_y: Chunk y coordinate in chunk space
+
+        Returns:
+            (CHUNK_SIZE, CHUNK_SIZE) uint8 block array, or None on a miss
+        """
+        with self._db_lock:
+            data = self._db.get(self._key(generation, chunk_x, chunk_y))
+        if data is None:
+            return None
+
+        try:
+            raw = zlib.decompress(data)
+        except zlib.error:
+            return None
+
+        # Ignore entries written with a different chunk size
+        if len(raw) != CHUNK_SIZE * CHUNK_SIZE:
+            return None
+        return np.frombuffer(raw, dtype=np.uint8).reshape((CHUNK_SIZE, CHUNK_SIZE)).copy()
+
+    def store(self, generation: str, chunk_x: int, chunk_y: int, blocks: np.ndarray) -> None:
+        """Queue a chunk's blocks to be written in the background"""
+        # Snapshot the bytes now so later edits to the chunk aren't cached
+        self._writes.put((self._key(generation, chunk_x, chunk_y), blocks.tobytes()))
+
+    def _write_loop(self) -> None:
+        """Compress and write queued chunks until close() is called"""
+        while True:
+            item = self._writes.get()
+            if item is None:
+                break
+
+            key, raw = item
+            data = zlib.compress(raw)
+            with self._db_lock:
+                self._db[key] = data
+
+    def close(self) -> None:
+        """Flush pending writes and close the cache"""
+        self._writes.put(None)
+        self._writer.join()
+        with self._db_lock:
+            self._db.close()
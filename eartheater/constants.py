@@ -1,5 +1,5 @@
 """Game constants"""
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 import random
 from typing import Tuple, Dict
 import pygame
@@ -45,9 +45,12 @@ class BlockType(Enum):
     FLUID = auto()       # Fluid block (water, lava)
 
 # Material types and properties
-class MaterialType(Enum):
+class MaterialType(IntEnum):
+    # Values are the uint8 ids stored in chunk block arrays, AIR is 0 so
+    # zero-filled arrays are empty
+    
     # Special materials
-    AIR = auto()
+    AIR = 0
     VOID = auto()  # For out-of-bounds or unloaded areas
     
     # Surface materials
@@ -247,6 +250,9 @@ class WorldGenSettings:
         self.stone_transition_depth = 50 # Where stone begins
         self.deep_stone_depth = 150      # Where deep stone begins
         
+        # Directory for the on-disk chunk cache, None disables it
+        self.chunk_cache_dir = None
+        
     def get_terrain_amplitude(self):
         """Get terrain amplitude based on roughness"""
         base = 40  # Increased base amplitude for more dramatic hills
@@ -442,7 +442,7 @@ class Player(Entity):
             pos_y = int(player_center_y + math.sin(self.drill_angle) * dist)
             
             # Check material hardness at this point
-            material = physics.world.get_tile(pos_x, pos_y)
+            material = physics.world.get_block(pos_x, pos_y)
             
             # Skip air
             if material == MaterialType.AIR:
@@ -498,20 +498,20 @@ class Player(Entity):
         
         if self.move_left:
             for y in range(y1, y2 + 1):
-                if physics.world.get_tile(x1, y) != MaterialType.AIR:
+                if physics.world.get_block(x1, y) != MaterialType.AIR:
                     dig_positions.append((x1, y))
         elif self.move_right:
             for y in range(y1, y2 + 1):
-                if physics.world.get_tile(x2, y) != MaterialType.AIR:
+                if physics.world.get_block(x2, y) != MaterialType.AIR:
                     dig_positions.append((x2, y))
                     
         if self.move_up:
             for x in range(x1, x2 + 1):
-                if physics.world.get_tile(x, y1) != MaterialType.AIR:
+                if physics.world.get_block(x, y1) != MaterialType.AIR:
                     dig_positions.append((x, y1))
         elif self.move_down:
             for x in range(x1, x2 + 1):
-                if physics.world.get_tile(x, y2) != MaterialType.AIR:
+                if physics.world.get_block(x, y2) != MaterialType.AIR:
                     dig_positions.append((x, y2))
         
         # If we found solid blocks, auto-dig
@@ -522,7 +522,7 @@ class Player(Entity):
                     continue
                     
                 # Check material hardness
-                material = physics.world.get_tile(x, y)
+                material = physics.world.get_block(x, y)
                 hardness = MATERIAL_HARDNESS.get(material, 1)
                 
                 # Skip if too hard (need explicit digging)
@@ -598,7 +598,7 @@ class Player(Entity):
         material = None
         try:
             from eartheater.constants import MATERIAL_COLORS
-            material = self.physics.world.get_tile(x, y)
+            material = self.physics.world.get_block(x, y)
             
             # Get base particle color from material (default to gray if not found)
             base_color = MATERIAL_COLORS.get(material, (180, 180, 180))
@@ -87,15 +87,22 @@ class Game:
         # Initialize loading screen with world reference for preview
         self.loading_screen = LoadingScreen(self._finish_loading, self.world)
         
+        # Generate the starting area in the background while the loading screen runs
+        self.world.start_preload()
+        
     def _finish_loading(self):
         """Complete game initialization after loading"""
         try:
+            # The preload thread must be done before the main thread uses chunks
+            self.world.wait_for_preload()
+            
             # Force world to be preloaded
             self.world.preloaded = True
             self.world.loading_progress = 1.0
             
-            # Find a good spawn location - use the center of the world
-            spawn_x, spawn_y = self.world.width // 2, 80  # Centered spawn
+            # Spawn in the sky above the world's spawn column, which the
+            # preload generated the chunks around
+            spawn_x, spawn_y = self.world.spawn_position[0], 80
             
             # Create player at spawn location with ultra-minimal model
             try:
@@ -338,6 +345,9 @@ class Game:
         # This method now separates rendering chunks from physics simulation chunks
         self.world.update_active_chunks(self.player.x, self.player.y)
         
+        # Pick up chunks the worker pool has finished generating
+        self.world.poll_chunk_requests()
+        
         # Scale player movement by delta time for consistent speed
         self.player.update(self.physics, dt)
         
@@ -568,5 +578,7 @@ class Game:
             # Remove redundant display flip and frame rate limiting
             # This is already handled in the renderer
         
-        # Clean up resources
+        # Clean up resources - there is no world yet if we quit from the menu
+        if self.world is not None:
+            self.world.shutdown()
         self.renderer.cleanup()
\ No newline at end of file
@@ -3,7 +3,6 @@ Physics simulation for EarthEater
 """
 from typing import List, Tuple, Set
 import random
-import math
 
 from eartheater.constants import (
     MaterialType, BlockType, GRAVITY, MATERIAL_FALLS, MATERIAL_LIQUIDITY, CHUNK_SIZE,
@@ -561,13 +560,12 @@ class PhysicsEngine:
             radius: Radius of the hole in tiles
             destroy_all: If True, destroy all material types, otherwise only dirt and sand
         """
+        radius_sq = radius * radius
         for dy in range(-radius, radius + 1):
             for dx in range(-radius, radius + 1):
-                # Get distance from center (circular shape)
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                # Skip tiles outside the radius
-                if distance > radius:
+                # Skip tiles outside the radius (circular shape) - use squared
+                # distance comparison to avoid sqrt
+                if dx*dx + dy*dy > radius_sq:
                     continue
                 
                 # Calculate target position
@@ -16,6 +16,17 @@ from eartheater.constants import (
 from eartheater.world import World
 from eartheater.entities import Player
 
+# Natural materials that get per-tile color variation, built once for fast membership tests
+_VARIED_MATERIALS = frozenset([
+    MaterialType.DIRT_LIGHT, MaterialType.DIRT_MEDIUM, MaterialType.DIRT_DARK,
+    MaterialType.STONE_LIGHT, MaterialType.STONE_MEDIUM, MaterialType.STONE_DARK,
+    MaterialType.DEEP_STONE_LIGHT, MaterialType.DEEP_STONE_MEDIUM, MaterialType.DEEP_STONE_DARK,
+    MaterialType.SAND_LIGHT, MaterialType.SAND_DARK,
+    MaterialType.GRAVEL_LIGHT, MaterialType.GRAVEL_DARK,
+    MaterialType.GRASS_LIGHT, MaterialType.GRASS_MEDIUM, MaterialType.GRASS_DARK,
+    MaterialType.CLAY_LIGHT, MaterialType.CLAY_DARK
+])
+
 
 class Camera:
     """Camera that follows the player with zoom capability"""
@@ -698,6 +709,10 @@ class Renderer:
             if chunk.needs_render_update or (chunk.x, chunk.y) not in self.chunk_surfaces:
                 self._update_chunk_surface(chunk)
                 chunk.needs_render_update = False
+                chunk.dirty_rows = 0
+            elif chunk.dirty_rows:
+                self._update_chunk_rows(chunk, chunk.dirty_rows)
+                chunk.dirty_rows = 0
         
         # Render visible chunks
         for chunk in world.get_active_chunks():
@@ -733,8 +748,49 @@ class Renderer:
         surface = self.chunk_surfaces[(chunk.x, chunk.y)]
         surface.fill((0, 0, 0, 0))  # Clear with transparency
         
-        # First render the background blocks
+        # Sky chunks have nothing to draw - skip the per-tile passes entirely
+        if chunk.is_empty():
+            return
+        
+        self._draw_chunk_rows(surface, chunk, range(CHUNK_SIZE))
+    
+    def _update_chunk_rows(self, chunk, dirty_rows: int) -> None:
+        """
+        Redraw only the edited rows of a chunk's cached surface
+        
+        Args:
+            chunk: The chunk to update
+            dirty_rows: Bitmap of edited rows, bit y = row y
+        """
+        surface = self.chunk_surfaces[(chunk.x, chunk.y)]
+        
+        # A block's bottom edge shadow lands in the row below it, so an edit
+        # changes the pixels of its own row and of the next one
+        pixel_rows = (dirty_rows | (dirty_rows << 1)) & ((1 << CHUNK_SIZE) - 1)
+        
+        row_width = CHUNK_SIZE * TILE_SIZE
         for y in range(CHUNK_SIZE):
+            if not (pixel_rows >> y) & 1:
+                continue
+            
+            # Clip to this row so the neighbouring rows keep their pixels
+            surface.set_clip((0, y * TILE_SIZE, row_width, TILE_SIZE))
+            surface.fill((0, 0, 0, 0))
+            self._draw_chunk_rows(surface, chunk, (y - 1, y) if y > 0 else (y,))
+        
+        surface.set_clip(None)
+    
+    def _draw_chunk_rows(self, surface: pygame.Surface, chunk, rows) -> None:
+        """
+        Draw the given rows of a chunk onto its surface
+        
+        Args:
+            surface: The chunk's cached surface
+            chunk: The chunk to draw
+            rows: Local row indices to draw, top to bottom
+        """
+        # First render the background blocks
+        for y in rows:
             for x in range(CHUNK_SIZE):
                 background_material = chunk.get_block(x, y, BlockType.BACKGROUND)
                 
@@ -759,7 +815,7 @@ class Renderer:
                 pygame.draw.rect(surface, bg_color, rect)
         
         # Now render the foreground blocks
-        for y in range(CHUNK_SIZE):
+        for y in rows:
             for x in range(CHUNK_SIZE):
                 foreground_material = chunk.get_block(x, y, BlockType.FOREGROUND)
                 
@@ -777,15 +833,7 @@ class Renderer:
                 variation_seed = (world_x * 17 + world_y * 31) % 30 - 15  # -15 to +15 range
                 
                 # Apply variation to natural materials
-                if foreground_material in [
-                    MaterialType.DIRT_LIGHT, MaterialType.DIRT_MEDIUM, MaterialType.DIRT_DARK,
-                    MaterialType.STONE_LIGHT, MaterialType.STONE_MEDIUM, MaterialType.STONE_DARK,
-                    MaterialType.DEEP_STONE_LIGHT, MaterialType.DEEP_STONE_MEDIUM, MaterialType.DEEP_STONE_DARK,
-                    MaterialType.SAND_LIGHT, MaterialType.SAND_DARK,
-                    MaterialType.GRAVEL_LIGHT, MaterialType.GRAVEL_DARK,
-                    MaterialType.GRASS_LIGHT, MaterialType.GRASS_MEDIUM, MaterialType.GRASS_DARK,
-                    MaterialType.CLAY_LIGHT, MaterialType.CLAY_DARK
-                ]:
+                if foreground_material in _VARIED_MATERIALS:
                     if isinstance(color, tuple) and len(color) >= 3:
                         r = max(0, min(255, color[0] + variation_seed))
                         g = max(0, min(255, color[1] + variation_seed))
@@ -1503,17 +1503,23 @@ class LoadingScreen:
         self.preview_surface.fill((0, 30, 0))  # Dark green background
         
         # Check if we have preview data
-        if hasattr(self.world, 'preview_chunks') and self.world.preview_chunks:
+        preview_count = getattr(self.world, 'preview_count', 0)
+        if preview_count:
             # Calculate preview dimensions
             preview_width = self.preview_surface.get_width()
             preview_height = self.preview_surface.get_height()
             
+            # Only the first preview_count entries of the preview arrays are filled
+            preview_cxs = self.world.preview_cxs[:preview_count]
+            preview_cys = self.world.preview_cys[:preview_count]
+            preview_tiles = self.world.preview_tiles[:preview_count]
+            
             # Find min/max chunk coordinates to center the preview
-            if self.world.preview_chunks:
-                min_x = min(chunk[0] for chunk in self.world.preview_chunks)
-                max_x = max(chunk[0] for chunk in self.world.preview_chunks)
-                min_y = min(chunk[1] for chunk in self.world.preview_chunks)
-                max_y = max(chunk[1] for chunk in self.world.preview_chunks)
+            if preview_count:
+                min_x = int(preview_cxs.min())
+                max_x = int(preview_cxs.max())
+                min_y = int(preview_cys.min())
+                max_y = int(preview_cys.max())
                 
                 # Calculate world width and height in chunks
                 world_width = max_x - min_x + 1
@@ -1534,7 +1540,7 @@ class LoadingScreen:
                 # Render each preview chunk
                 from eartheater.constants import MaterialType, MATERIAL_COLORS
                 
-                for chunk_x, chunk_y, preview_data in self.world.preview_chunks:
+                for chunk_x, chunk_y, preview_data in zip(preview_cxs, preview_cys, preview_tiles):
                     # Calculate position in preview
                     px = offset_x + (chunk_x - min_x) * preview_chunk_size
                     py = offset_y + (chunk_y - min_y) * preview_chunk_size
@@ -1,28 +1,252 @@
 """World generation and management module"""
 import random
 import math
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
 from typing import Dict, Tuple, List, Optional, Set, Any
-import noise
 
 from eartheater.constants import (
-    BIOME_SKY_COLORS, CHUNK_SIZE, ACTIVE_CHUNKS_RADIUS, 
+    BIOME_SKY_COLORS, CHUNK_SIZE, ACTIVE_CHUNKS_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE,
     MaterialType, BiomeType, BlockType,
     DIRT_MATERIALS, GRASS_MATERIALS, STONE_MATERIALS, DEEP_STONE_MATERIALS,
     WorldGenSettings
 )
+from eartheater.perlin import perlin1d_channels
+from eartheater.chunk_cache import WorldCache, generation_id
+
+# Loading screen preview samples one block out of every PREVIEW_STEP in each axis
+PREVIEW_STEP = 4
+PREVIEW_OFFSET = PREVIEW_STEP // 2
+
+# Maximum number of columns kept in the terrain height cache
+TERRAIN_HEIGHT_CACHE_LIMIT = 1 << 20
+
+# Marks terrain height cache entries that haven't been computed yet
+_HEIGHT_UNSET = np.iinfo(np.int32).min
+
+# World to chunk coordinates with shifts and masks, CHUNK_SIZE is a power of two
+_CHUNK_SHIFT = CHUNK_SIZE.bit_length() - 1
+_CHUNK_MASK = CHUNK_SIZE - 1
+assert CHUNK_SIZE == 1 << _CHUNK_SHIFT, "CHUNK_SIZE must be a power of two"
+
+# Missing active chunks up to this many chunks either side of the center are
+# generated on the spot, the rest on the worker pool. This covers the screen
+# wherever the player is within the center chunk, so terrain in view never
+# waits for a worker.
+SYNC_CHUNKS_X = math.ceil(SCREEN_WIDTH / (2 * TILE_SIZE * CHUNK_SIZE))
+SYNC_CHUNKS_Y = math.ceil(SCREEN_HEIGHT / (2 * TILE_SIZE * CHUNK_SIZE))
+
+# Worker processes for async chunk generation - each one re-imports the game
+CHUNK_WORKERS = 2
+
+# Chunk block arrays initially reserved in the world's block slab
+BLOCK_SLAB_INITIAL_SLOTS = (2 * ACTIVE_CHUNKS_RADIUS + 1) ** 2
+
+# Enum members used in per-block hot paths, bound once to skip the class lookup
+_M_AIR = MaterialType.AIR
+_M_VOID = MaterialType.VOID
+_B_FOREGROUND = BlockType.FOREGROUND
+
+# MaterialType members indexed by their stored uint8 value, avoids the enum value lookup
+_MATERIALS_BY_VALUE = {material.value: material for material in MaterialType}
+_INT_TO_MATERIAL: Tuple[Optional[MaterialType], ...] = tuple(
+    _MATERIALS_BY_VALUE.get(value) for value in range(max(_MATERIALS_BY_VALUE) + 1)
+)
+
+# Terrain layers from the surface down, and the material variants used for each
+_LAYER_AIR = 0
+_LAYER_GRASS = 1
+_LAYER_TOP_SOIL = 2
+_LAYER_DIRT = 3
+_LAYER_STONE = 4
+_LAYER_DEEP_STONE = 5
+_LAYER_PALETTES = tuple(
+    np.array([material.value for material in materials], dtype=np.uint8)
+    for materials in (
+        [MaterialType.AIR],
+        GRASS_MATERIALS,
+        [MaterialType.DIRT_LIGHT],
+        DIRT_MATERIALS,
+        STONE_MATERIALS,
+        DEEP_STONE_MATERIALS,
+    )
+)
+
+# (top, horizon) sky colors per biome, built once so lookups return a shared tuple
+_SKY_COLORS = {
+    biome: (colors['top'], colors['horizon']) for biome, colors in BIOME_SKY_COLORS.items()
+}
+_SKY_FALLBACK = ((92, 148, 252), (210, 230, 255))
+
+
+def select_variant(palette: np.ndarray, rolls: np.ndarray) -> np.ndarray:
+    """Pick a material variant from a palette for each random roll
+    
+    Args:
+        palette: uint8 array of MaterialType values to choose from
+        rolls: Random values in [0, 1), one per block
+        
+    Returns:
+        uint8 array of MaterialType values, same shape as rolls
+    """
+    return np.take(palette, (rolls * len(palette)).astype(np.intp))
+
+
+def _circle_offsets(radius: int) -> np.ndarray:
+    """Chunk offsets within a circular radius, nearest first
+    
+    Returns:
+        (N, 2) int array of (dx, dy) offsets with dx*dx + dy*dy <= radius*radius,
+        sorted by distance from the center
+    """
+    span = np.arange(-radius, radius + 1)
+    dx, dy = np.meshgrid(span, span, indexing='ij')
+    dist_sq = dx*dx + dy*dy
+    mask = dist_sq <= radius*radius
+    order = np.argsort(dist_sq[mask], kind='stable')
+    return np.stack([dx[mask][order], dy[mask][order]], axis=1)
+
+
+def _noise_seeds(settings: WorldGenSettings) -> Tuple[int, int]:
+    """Seeds for the (large hills, surface detail) terrain noise fields
+    
+    Shared by the world and the chunk workers so both generate the same terrain.
+    """
+    return settings.seed, settings.seed + 1
+
+
+def _terrain_heights(xs: np.ndarray, seed_base: int, seed_detail: int, amplitude: int) -> np.ndarray:
+    """Evaluate the terrain height noise for an array of x coordinates"""
+    # Sample both noise fields in one pass
+    large_scale_noise, small_scale_noise = perlin1d_channels(xs, [
+        (0.01, 1, seed_base),     # Use a scale of 0.01 for large hills
+        (0.05, 2, seed_detail),   # Add some smaller details with a higher frequency
+    ])
+    
+    # Calculate height (0-1 range * amplitude + base height)
+    # Adjusted for ground level to be around y=100 (more space above ground)
+    combined = large_scale_noise.astype(np.float64) + small_scale_noise.astype(np.float64) * 0.2
+    return ((combined * 0.5 + 0.5) * amplitude + 100).astype(np.int64)
+
+
+def _chunk_rng(seed: int, chunk_x: int, chunk_y: int) -> np.random.Generator:
+    """Create the random generator for a chunk's material variants
+    
+    Seeded from the world seed and chunk coordinates, so a chunk gets the same
+    variants no matter when, in which process or on which Python build it is
+    generated. Negative coordinates are passed as their 32-bit two's complement.
+    """
+    return np.random.default_rng(
+        np.random.SeedSequence([seed, chunk_x & 0xFFFFFFFF, chunk_y & 0xFFFFFFFF])
+    )
+
+
+def _layer_starts(settings: WorldGenSettings) -> np.ndarray:
+    """Depth below the surface where each terrain layer starts
+    
+    Each entry is a bin edge for np.digitize, so the bin index of a depth is
+    its layer id. A running maximum keeps the edges sorted (first matching
+    layer wins) even with unusual thickness settings.
+    """
+    return np.maximum.accumulate([
+        0,                                  # Above terrain is air
+        1,                                  # Grass on top layer
+        settings.grass_layer_thickness,     # Thin top soil
+        settings.dirt_layer_thickness,      # Thick dirt layer
+        settings.stone_transition_depth,    # Upper stone layer, deep stone below
+    ])
+
+
+def _fill_chunk_blocks(blocks: np.ndarray, heights: np.ndarray, world_y_start: int,
+                       layer_starts: np.ndarray, rng: np.random.Generator) -> None:
+    """Fill an all-air chunk block array with layered terrain
+    
+    The whole chunk is filled with array operations: every block is classified
+    into a layer by its depth below its column's surface, and each layer picks
+    its variants from one array of random rolls drawn for the whole chunk.
+    
+    Args:
+        blocks: (CHUNK_SIZE, CHUNK_SIZE) uint8 array to fill, indexed [y, x]
+        heights: Terrain height for each column of the chunk
+        world_y_start: World y coordinate of the chunk's top row
+        layer_starts: Layer depth thresholds from _layer_starts()
+        rng: Random generator for the chunk, see _chunk_rng()
+    """
+    # Specialize chunks that lie entirely inside a single layer
+    if world_y_start + CHUNK_SIZE <= heights.min():
+        # Entirely above the surface - already all air
+        return
+    
+    # One roll in [0, 1) per block, scaled to a palette index per layer
+    rolls = rng.random((CHUNK_SIZE, CHUNK_SIZE))
+    
+    if world_y_start >= heights.max() + layer_starts[_LAYER_DEEP_STONE - 1]:
+        # Entirely in the deep stone layer - fill with random deep stone variants
+        blocks[:, :] = select_variant(_LAYER_PALETTES[_LAYER_DEEP_STONE], rolls)
+        return
+    
+    # Depth below the surface for every block, rows are y - INVERTED Y AXIS
+    world_ys = np.arange(world_y_start, world_y_start + CHUNK_SIZE)
+    depth = world_ys[:, None] - heights[None, :]
+    
+    # Layered terrain generation - the bin index is the layer id
+    layers = np.digitize(depth, layer_starts)
+    
+    # Fill each layer with its material variants (air is already in place)
+    for layer in range(_LAYER_GRASS, len(_LAYER_PALETTES)):
+        mask = layers == layer
+        if not mask.any():
+            continue
+        blocks[mask] = select_variant(_LAYER_PALETTES[layer], rolls[mask])
+
+
+def generate_chunk_blocks(chunk_x: int, chunk_y: int, settings: WorldGenSettings) -> np.ndarray:
+    """Generate the block ids for one chunk without any World state
+    
+    Entry point for the chunk worker pool, so it only depends on its
+    (picklable) arguments.
+    
+    Args:
+        chunk_x: Chunk x coordinate in chunk space
+        chunk_y: Chunk y coordinate in chunk space
+        settings: World generation settings
+        
+    Returns:
+        (CHUNK_SIZE, CHUNK_SIZE) uint8 array of MaterialType values
+    """
+    world_x_start = chunk_x * CHUNK_SIZE
+    xs = np.arange(world_x_start, world_x_start + CHUNK_SIZE)
+    seed_base, seed_detail = _noise_seeds(settings)
+    heights = _terrain_heights(xs, seed_base, seed_detail, settings.get_terrain_amplitude())
+    
+    blocks = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)  # All air
+    _fill_chunk_blocks(blocks, heights, chunk_y * CHUNK_SIZE, _layer_starts(settings),
+                       _chunk_rng(settings.seed, chunk_x, chunk_y))
+    return blocks
+
 
 class Chunk:
     """A chunk of the world containing blocks and entities"""
-    def __init__(self, x: int, y: int, size: int = CHUNK_SIZE):
+    __slots__ = ('x', 'y', 'size', 'blocks', 'block_types',
+                 'last_physics_update', 'active', 'needs_render_update', 'dirty_rows')
+    
+    def __init__(self, x: int, y: int, size: int = CHUNK_SIZE, blocks: Optional[np.ndarray] = None):
         self.x = x  # Chunk x coordinate in chunk space
         self.y = y  # Chunk y coordinate in chunk space
         self.size = size
-        self.blocks = np.full((size, size), MaterialType.AIR, dtype=object)
-        self.block_types = np.full((size, size), BlockType.FOREGROUND, dtype=object)
+        # Blocks are stored as MaterialType values in a compact uint8 array,
+        # the only per-block data that generation, physics and rendering read.
+        # Chunks in a world are given an all-air view into its block slab.
+        self.blocks = np.zeros((size, size), dtype=np.uint8) if blocks is None else blocks
+        # Rarely used BlockType values, allocated on the first non-foreground write
+        self.block_types: Optional[np.ndarray] = None
         self.last_physics_update = 0
         self.active = False
-        self.needs_render_update = True
+        self.needs_render_update = True  # Whole chunk must be redrawn
+        self.dirty_rows = 0  # Bitmap of rows edited since the last redraw, bit y = row y
         
     def world_to_chunk_coords(self, world_x: int, world_y: int) -> Tuple[int, int]:
         """Convert world coordinates to local chunk coordinates"""
@@ -33,26 +257,30 @@ class Chunk:
     def get_block(self, local_x: int, local_y: int, block_type: BlockType = BlockType.FOREGROUND) -> MaterialType:
         """Get a block at local coordinates"""
         if 0 <= local_x < self.size and 0 <= local_y < self.size:
-            if block_type == BlockType.FOREGROUND:
-                return self.blocks[local_y][local_x]
+            if block_type == _B_FOREGROUND:
+                return _INT_TO_MATERIAL[self.blocks[local_y, local_x]]
             else:
                 # For now, we don't have real background blocks, so return AIR for background
-                return MaterialType.AIR
-        return MaterialType.VOID
+                return _M_AIR
+        return _M_VOID
         
     def set_block(self, local_x: int, local_y: int, material: MaterialType,
                  block_type: BlockType = BlockType.FOREGROUND) -> bool:
         """Set a block at local coordinates"""
         if 0 <= local_x < self.size and 0 <= local_y < self.size:
-            self.blocks[local_y][local_x] = material
-            self.block_types[local_y][local_x] = block_type
-            self.needs_render_update = True
+            self.blocks[local_y, local_x] = material.value
+            if self.block_types is not None:
+                self.block_types[local_y, local_x] = block_type.value
+            elif block_type != _B_FOREGROUND:
+                self.block_types = np.full((self.size, self.size), _B_FOREGROUND.value, dtype=np.uint8)
+                self.block_types[local_y, local_x] = block_type.value
+            self.dirty_rows |= 1 << local_y
             return True
         return False
         
     def is_empty(self) -> bool:
         """Check if chunk is completely empty (all air)"""
-        return np.all(self.blocks == MaterialType.AIR)
+        return not self.blocks.any()
 
 class World:
     """The game world containing all chunks, terrain, and game state"""
@@ -60,97 +288,209 @@ class World:
         """Initialize the world with given settings"""
         self.chunks: Dict[Tuple[int, int], Chunk] = {}
         self.active_chunks: Set[Tuple[int, int]] = set()
+        self._active_chunk_list: List[Chunk] = []  # Chunks in active_chunks, see get_active_chunks()
+        self._active_center: Optional[Tuple[int, int, int]] = None  # Last (chunk_x, chunk_y, radius)
+        # (active offsets, prefetch ring offsets) by radius, see _get_offset_tables()
+        self._offset_tables: Dict[int, Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]] = {}
+        
+        # Chunks being generated on the worker pool, keyed like self.chunks
+        self._chunk_executor: Optional[ProcessPoolExecutor] = None
+        self._pending_chunks: Dict[Tuple[int, int], Tuple[int, int, Future]] = {}
+        
+        # Chunk blocks live in one contiguous slab, one slot per loaded chunk
+        self._block_slab = np.empty((BLOCK_SLAB_INITIAL_SLOTS, CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+        self._chunk_slots: Dict[Tuple[int, int], int] = {}  # Chunk key -> slab slot, in load order
+        
+        # Last chunk used by get_block/set_block, see _get_chunk_cached()
+        self._last_chunk_x: Optional[int] = None
+        self._last_chunk_y: Optional[int] = None
+        self._last_chunk: Optional[Chunk] = None
+        
         self.settings = settings or WorldGenSettings()
+        # Seed the global RNG that physics draws from. Terrain generation uses
+        # its own per-chunk numpy generators, see _chunk_rng()
         random.seed(self.settings.seed)
-        np.random.seed(self.settings.seed)
         
         # Fixed world size to prevent out-of-bounds errors
         self.width = 10000  # Large but finite world width
         self.height = 2000  # Large but finite world height
         
         # World generation parameters
-        self.terrain_height_cache = {}
+        # Heights for a window of columns starting at _height_cache_origin
+        self.terrain_height_cache = np.empty(0, dtype=np.int32)
+        self._height_cache_origin = 0
         self.terrain_amplitude = self.settings.get_terrain_amplitude()
         self.spawn_position = (self.width // 2, 80)  # Centered spawn point
         
         # Initialize noise functions for terrain generation
         self.noise_seed = self.settings.seed
+        self._seed_base, self._seed_detail = _noise_seeds(self.settings)
+        
+        # Layer depth thresholds, computed once instead of per chunk
+        self._layer_starts = _layer_starts(self.settings)
+        
+        # Optional on-disk cache of generated chunks
+        self.chunk_cache: Optional[WorldCache] = None
+        self._cache_generation = ""  # See generation_id()
+        if self.settings.chunk_cache_dir:
+            self.chunk_cache = WorldCache(self.settings.chunk_cache_dir)
+            self._cache_generation = generation_id(self.settings)
         
         # Loading state
         self.loading_progress = 0.0
         self.preloaded = False
+        self._preload_thread: Optional[threading.Thread] = None
+        
+        # Loading screen preview, stored as parallel arrays (one entry per chunk)
+        preview_size = CHUNK_SIZE // PREVIEW_STEP
+        self.preview_cxs = np.empty(0, dtype=np.int32)
+        self.preview_cys = np.empty(0, dtype=np.int32)
+        self.preview_tiles = np.zeros((0, preview_size, preview_size), dtype=np.uint8)
+        self.preview_count = 0
         
     def world_to_chunk_coords(self, world_x: int, world_y: int) -> Tuple[int, int]:
         """Convert world coordinates to chunk coordinates"""
-        chunk_x = math.floor(world_x / CHUNK_SIZE)
-        chunk_y = math.floor(world_y / CHUNK_SIZE)
+        # Floor first so float positions work, then shift instead of dividing
+        chunk_x = math.floor(world_x) >> _CHUNK_SHIFT
+        chunk_y = math.floor(world_y) >> _CHUNK_SHIFT
         return chunk_x, chunk_y
     
     def get_block(self, world_x: int, world_y: int, block_type: BlockType = BlockType.FOREGROUND) -> MaterialType:
-        """Get a block at world coordinates"""
-        chunk_x, chunk_y = self.world_to_chunk_coords(world_x, world_y)
-        chunk = self.get_chunk(chunk_x, chunk_y)
+        """Get a block at integer world coordinates"""
+        chunk = self._get_chunk_cached(world_x >> _CHUNK_SHIFT, world_y >> _CHUNK_SHIFT)
         
-        if chunk:
-            local_x, local_y = chunk.world_to_chunk_coords(world_x, world_y)
-            return chunk.get_block(local_x, local_y, block_type)
-        return MaterialType.VOID
+        if block_type == _B_FOREGROUND:
+            return _INT_TO_MATERIAL[chunk.blocks[world_y & _CHUNK_MASK, world_x & _CHUNK_MASK]]
+        return chunk.get_block(world_x & _CHUNK_MASK, world_y & _CHUNK_MASK, block_type)
         
-    def get_tile(self, world_x: int, world_y: int) -> MaterialType:
-        """Alias for get_block for backward compatibility"""
-        return self.get_block(world_x, world_y)
-    
     def set_block(self, world_x: int, world_y: int, material: MaterialType,
                  block_type: BlockType = BlockType.FOREGROUND) -> bool:
-        """Set a block at world coordinates"""
-        chunk_x, chunk_y = self.world_to_chunk_coords(world_x, world_y)
+        """Set a block at integer world coordinates"""
+        chunk = self._get_chunk_cached(world_x >> _CHUNK_SHIFT, world_y >> _CHUNK_SHIFT)
+        return chunk.set_block(world_x & _CHUNK_MASK, world_y & _CHUNK_MASK, material, block_type)
+    
+    def _get_chunk_cached(self, chunk_x: int, chunk_y: int) -> Chunk:
+        """get_chunk with a one-entry cache, since block accesses come in runs
+        within the same chunk"""
+        if chunk_x == self._last_chunk_x and chunk_y == self._last_chunk_y:
+            return self._last_chunk
+        
         chunk = self.get_chunk(chunk_x, chunk_y)
+        self._last_chunk_x = chunk_x
+        self._last_chunk_y = chunk_y
+        self._last_chunk = chunk
+        return chunk
+    
+    def _new_chunk(self, chunk_x: int, chunk_y: int) -> Chunk:
+        """Add an all-air chunk to the world, its blocks in the next block slab slot
         
-        if chunk:
-            local_x, local_y = chunk.world_to_chunk_coords(world_x, world_y)
-            return chunk.set_block(local_x, local_y, material, block_type)
-        return False
+        Callers fill the returned chunk's blocks in place. If the chunk is
+        already loaded, the new chunk gets its own array and isn't added.
+        """
+        chunk_key = (chunk_x, chunk_y)
+        if chunk_key in self._chunk_slots:
+            return Chunk(chunk_x, chunk_y)
+        
+        slot = len(self._chunk_slots)
+        if slot == len(self._block_slab):
+            self._grow_block_slab()
+        self._chunk_slots[chunk_key] = slot
+        
+        blocks = self._block_slab[slot]
+        blocks.fill(_M_AIR)
+        chunk = self.chunks[chunk_key] = Chunk(chunk_x, chunk_y, blocks=blocks)
+        return chunk
+    
+    def _grow_block_slab(self) -> None:
+        """Double the block slab and point loaded chunks at the new storage"""
+        old_slab = self._block_slab
+        old_capacity = len(old_slab)
+        self._block_slab = np.empty((old_capacity * 2,) + old_slab.shape[1:], dtype=np.uint8)
+        self._block_slab[:old_capacity] = old_slab
+        
+        for chunk_key, slot in self._chunk_slots.items():
+            self.chunks[chunk_key].blocks = self._block_slab[slot]
     
     def get_chunk(self, chunk_x: int, chunk_y: int) -> Optional[Chunk]:
         """Get a chunk at given chunk coordinates, generate if needed"""
         chunk_key = (chunk_x, chunk_y)
         
-        if chunk_key not in self.chunks:
+        chunk = self.chunks.get(chunk_key)
+        if chunk is None:
             # Create new chunk
-            self.chunks[chunk_key] = self.generate_chunk(chunk_x, chunk_y)
+            chunk = self.generate_chunk(chunk_x, chunk_y)
         
-        return self.chunks.get(chunk_key)
+        return chunk
     
     def update_active_chunks(self, center_x: int, center_y: int, radius: int = ACTIVE_CHUNKS_RADIUS):
-        """Update which chunks are active based on player position"""
+        """Update which chunks are active based on player position
+        
+        Called every frame, but the active set only changes when the player
+        crosses into a different chunk, so unchanged centers return early once
+        all their chunks are loaded. Missing chunks on screen are generated
+        right away, the others are queued on the worker pool and activated by
+        poll_chunk_requests(). Until then each call requests them again, in
+        case a request was lost.
+        """
         center_chunk_x, center_chunk_y = self.world_to_chunk_coords(center_x, center_y)
         
         # Use a smaller radius for better performance
         actual_radius = min(5, radius)  # Limit to 5 chunks radius for performance
         
-        # Calculate new active chunks
-        new_active_chunks = set()
-        for dx in range(-actual_radius, actual_radius + 1):
-            for dy in range(-actual_radius, actual_radius + 1):
-                # Use distance check for circular radius (more efficient)
-                if dx*dx + dy*dy <= actual_radius*actual_radius:
-                    chunk_key = (center_chunk_x + dx, center_chunk_y + dy)
-                    new_active_chunks.add(chunk_key)
-                    
-                    # Generate chunk if it doesn't exist
-                    if chunk_key not in self.chunks:
-                        self.chunks[chunk_key] = self.generate_chunk(chunk_key[0], chunk_key[1])
+        active_center = (center_chunk_x, center_chunk_y, actual_radius)
+        if active_center == self._active_center and \
+                len(self._active_chunk_list) == len(self.active_chunks):
+            return
+        self._active_center = active_center
         
-        # Update active status
-        for chunk_key in new_active_chunks:
-            if chunk_key in self.chunks:
-                self.chunks[chunk_key].active = True
+        active_offsets, prefetch_offsets = self._get_offset_tables(actual_radius)
+        
+        # Calculate new active chunks, requesting any that don't exist yet
+        new_active_chunks = set()
+        active_chunk_list = []
+        for dx, dy in active_offsets:
+            chunk_x = center_chunk_x + dx
+            chunk_y = center_chunk_y + dy
+            chunk_key = (chunk_x, chunk_y)
+            new_active_chunks.add(chunk_key)
+            
+            chunk = self.chunks.get(chunk_key)
+            if chunk is None:
+                if abs(dx) <= SYNC_CHUNKS_X and abs(dy) <= SYNC_CHUNKS_Y:
+                    chunk = self.generate_chunk(chunk_x, chunk_y)
+                else:
+                    self.request_chunk_async(chunk_x, chunk_y)
+                    # Cache hits are installed immediately
+                    chunk = self.chunks.get(chunk_key)
+                    if chunk is None:
+                        continue
+            chunk.active = True
+            active_chunk_list.append(chunk)
         
         for chunk_key in self.active_chunks - new_active_chunks:
             if chunk_key in self.chunks:
                 self.chunks[chunk_key].active = False
         
         self.active_chunks = new_active_chunks
+        self._active_chunk_list = active_chunk_list
+        
+        # Prefetch the ring just outside the active radius on the worker pool,
+        # so moving one chunk over rarely has to generate on the main thread
+        for dx, dy in prefetch_offsets:
+            self.request_chunk_async(center_chunk_x + dx, center_chunk_y + dy)
+    
+    def _get_offset_tables(self, radius: int) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Get the active chunk offsets and prefetch ring offsets for a radius
+        
+        Both tables are nearest first and computed once per radius.
+        """
+        tables = self._offset_tables.get(radius)
+        if tables is None:
+            active_offsets = [(dx, dy) for dx, dy in _circle_offsets(radius).tolist()]
+            # Offsets are sorted by distance, so the ring is everything past the circle
+            prefetch_offsets = [(dx, dy) for dx, dy in _circle_offsets(radius + 1).tolist()]
+            tables = self._offset_tables[radius] = (active_offsets, prefetch_offsets[len(active_offsets):])
+        return tables
         
     def get_chunks_in_radius(self, center_x: int, center_y: int, radius: int) -> List[Chunk]:
         """Get a list of chunks within a radius of the center position
@@ -165,111 +505,287 @@ class World:
         """
         center_chunk_x, center_chunk_y = self.world_to_chunk_coords(center_x, center_y)
         chunks = []
+        loaded_chunks = self.chunks
         
         for dx in range(-radius, radius + 1):
             for dy in range(-radius, radius + 1):
-                chunk_key = (center_chunk_x + dx, center_chunk_y + dy)
-                if chunk_key in self.chunks:
-                    chunks.append(self.chunks[chunk_key])
+                chunk = loaded_chunks.get((center_chunk_x + dx, center_chunk_y + dy))
+                if chunk is not None:
+                    chunks.append(chunk)
         
         return chunks
     
     def get_terrain_height(self, x: int) -> int:
         """Get terrain height at a given x coordinate with caching"""
-        if x in self.terrain_height_cache:
-            return self.terrain_height_cache[x]
+        index = x - self._height_cache_origin
+        if 0 <= index < len(self.terrain_height_cache):
+            height = self.terrain_height_cache[index]
+            if height != _HEIGHT_UNSET:
+                return int(height)
+        return int(self.get_terrain_heights(x, 1)[0])
+    
+    def get_terrain_heights(self, x_start: int, count: int) -> np.ndarray:
+        """Get terrain heights for a run of consecutive x coordinates
         
-        # Generate terrain height using simplex noise
-        # Use a scale of 0.01 for large hills
-        try:
-            large_scale_noise = noise.snoise1(x * 0.01, octaves=1, persistence=0.5, lacunarity=2.0, base=self.noise_seed)
-            
-            # Add some smaller details with a higher frequency
-            small_scale_noise = noise.snoise1(x * 0.05, octaves=2, persistence=0.5, lacunarity=2.0, base=self.noise_seed + 1) * 0.2
-        except AttributeError:
-            # Fallback to pnoise1 if snoise1 is not available
-            large_scale_noise = noise.pnoise1(x * 0.01, octaves=1, persistence=0.5, lacunarity=2.0, base=self.noise_seed)
+        Columns missing from the cache are evaluated together with a single
+        batched noise call rather than one call per column.
+        
+        Args:
+            x_start: First x coordinate
+            count: Number of consecutive columns
             
-            # Add some smaller details with a higher frequency
-            small_scale_noise = noise.pnoise1(x * 0.05, octaves=2, persistence=0.5, lacunarity=2.0, base=self.noise_seed + 1) * 0.2
+        Returns:
+            Array of terrain heights, one per column
+        """
+        self._reserve_height_cache(x_start, x_start + count)
+        
+        start = x_start - self._height_cache_origin
+        window = self.terrain_height_cache[start:start + count]
+        missing = window == _HEIGHT_UNSET
+        if missing.any():
+            xs = np.arange(x_start, x_start + count)[missing]
+            window[missing] = _terrain_heights(xs, self._seed_base, self._seed_detail,
+                                               self.terrain_amplitude)
+        return window.astype(np.int64)
+    
+    def _reserve_height_cache(self, x_start: int, x_end: int) -> None:
+        """Grow or move the terrain height cache window to cover [x_start, x_end)"""
+        cache = self.terrain_height_cache
+        old_start = self._height_cache_origin
+        old_end = old_start + len(cache)
+        if old_start <= x_start and x_end <= old_end:
+            return
+        
+        # Extend the window with spare room on the side that grew, doubling
+        # its size so repeated growth stays amortized
+        spare = max(len(cache), CHUNK_SIZE)
+        new_start = min(old_start, x_start - spare) if x_start < old_start else old_start
+        new_end = max(old_end, x_end + spare) if x_end > old_end else old_end
+        if not len(cache):
+            new_start, new_end = x_start - spare, x_end + spare
+        
+        # Keep memory bounded - far from the cached columns, start a new window
+        if new_end - new_start > TERRAIN_HEIGHT_CACHE_LIMIT:
+            new_start, new_end = x_start - CHUNK_SIZE, x_end + CHUNK_SIZE
+        
+        new_cache = np.full(new_end - new_start, _HEIGHT_UNSET, dtype=np.int32)
+        overlap_start = max(old_start, new_start)
+        overlap_end = min(old_end, new_end)
+        if overlap_start < overlap_end:
+            new_cache[overlap_start - new_start:overlap_end - new_start] = \
+                cache[overlap_start - old_start:overlap_end - old_start]
+        
+        self.terrain_height_cache = new_cache
+        self._height_cache_origin = new_start
+    
+    def generate_chunk(self, chunk_x: int, chunk_y: int) -> Chunk:
+        """Generate a new chunk with terrain and add it to the world
         
-        # Calculate height (0-1 range * amplitude + base height)
-        # Adjusted for ground level to be around y=100 (more space above ground)
-        height = int(((large_scale_noise + small_scale_noise) * 0.5 + 0.5) * self.terrain_amplitude + 100)
+        Use get_chunk() for chunks that may already be loaded, see _new_chunk().
+        """
+        chunk = self._new_chunk(chunk_x, chunk_y)
+        
+        # Reuse terrain generated with these settings in an earlier session
+        if self.chunk_cache is not None:
+            cached_blocks = self.chunk_cache.load(self._cache_generation, chunk_x, chunk_y)
+            if cached_blocks is not None:
+                chunk.blocks[:, :] = cached_blocks
+                return chunk
+        
+        # Terrain height only depends on x, so evaluate it once per column
+        heights = self.get_terrain_heights(chunk_x * CHUNK_SIZE, CHUNK_SIZE)
+        _fill_chunk_blocks(chunk.blocks, heights, chunk_y * CHUNK_SIZE, self._layer_starts,
+                           _chunk_rng(self.noise_seed, chunk_x, chunk_y))
+        
+        if self.chunk_cache is not None:
+            self.chunk_cache.store(self._cache_generation, chunk_x, chunk_y, chunk.blocks)
+        return chunk
+    
+    def request_chunk_async(self, chunk_x: int, chunk_y: int) -> None:
+        """Queue a chunk for generation on the worker pool
         
-        # Cache and return
-        self.terrain_height_cache[x] = height
-        return height
+        The chunk is added to the world by poll_chunk_requests once its worker
+        finishes. Chunks that already exist or are already queued are ignored.
+        """
+        chunk_key = (chunk_x, chunk_y)
+        if chunk_key in self.chunks or chunk_key in self._pending_chunks:
+            return
+        
+        # Cached chunks are cheap enough to load right away
+        if self.chunk_cache is not None:
+            cached_blocks = self.chunk_cache.load(self._cache_generation, chunk_x, chunk_y)
+            if cached_blocks is not None:
+                self._new_chunk(chunk_x, chunk_y).blocks[:, :] = cached_blocks
+                return
+        
+        try:
+            if self._chunk_executor is None:
+                # Spawned (not forked) workers don't inherit pygame or thread state
+                self._chunk_executor = ProcessPoolExecutor(
+                    max_workers=CHUNK_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+            future = self._chunk_executor.submit(generate_chunk_blocks, chunk_x, chunk_y, self.settings)
+        except (BrokenProcessPool, RuntimeError) as e:
+            # A worker died and broke the pool - start a new pool on the next
+            # request and generate this chunk here
+            print(f"Chunk worker pool failed, restarting it: {e}")
+            self._recover_broken_pool()
+            if chunk_key not in self.chunks:
+                self.generate_chunk(chunk_x, chunk_y)
+            return
+        self._pending_chunks[chunk_key] = (chunk_x, chunk_y, future)
     
-    def generate_chunk(self, chunk_x: int, chunk_y: int) -> Chunk:
-        """Generate a new chunk with terrain"""
-        chunk = Chunk(chunk_x, chunk_y)
+    def _recover_broken_pool(self) -> int:
+        """Drop a worker pool that lost a worker and generate its queued chunks here
         
-        # Calculate world coordinates for this chunk
-        world_x_start = chunk_x * CHUNK_SIZE
-        world_y_start = chunk_y * CHUNK_SIZE
+        Every request on a broken pool fails, so its futures are forgotten
+        rather than cancelled (the pool resolves them itself) or polled.
+        
+        Returns:
+            Number of chunks added
+        """
+        executor = self._chunk_executor
+        self._chunk_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        
+        lost_chunks = self._pending_chunks
+        self._pending_chunks = {}
+        
+        installed = 0
+        for chunk_key, (chunk_x, chunk_y, _) in lost_chunks.items():
+            if chunk_key not in self.chunks:
+                self._activate_if_wanted(chunk_key, self.generate_chunk(chunk_x, chunk_y))
+                installed += 1
+        return installed
+    
+    def _activate_if_wanted(self, chunk_key: Tuple[int, int], chunk: Chunk) -> None:
+        """Activate a chunk that entered the active radius while it was being generated"""
+        if chunk_key in self.active_chunks and not chunk.active:
+            chunk.active = True
+            self._active_chunk_list.append(chunk)
+    
+    def poll_chunk_requests(self) -> int:
+        """Add chunks whose async generation has finished to the world
         
-        # Generate terrain for each column in the chunk
-        for local_x in range(CHUNK_SIZE):
-            world_x = world_x_start + local_x
-            terrain_height = self.get_terrain_height(world_x)
+        Returns:
+            Number of chunks added
+        """
+        installed = 0
+        for chunk_key, (chunk_x, chunk_y, future) in list(self._pending_chunks.items()):
+            if not future.done():
+                continue
+            
+            error = None if future.cancelled() else future.exception()
+            if isinstance(error, BrokenProcessPool):
+                # Every other request queued on the pool is lost as well
+                installed += self._recover_broken_pool()
+                break
+            del self._pending_chunks[chunk_key]
             
-            # Fill blocks in this column
-            for local_y in range(CHUNK_SIZE):
-                world_y = world_y_start + local_y
-                
-                # Default to air
-                material = MaterialType.AIR
-                
-                # Layered terrain generation - INVERTED Y AXIS
-                if world_y < terrain_height:
-                    # Above terrain is air
-                    material = MaterialType.AIR
-                elif world_y == terrain_height:
-                    # Grass on top layer
-                    material = random.choice(GRASS_MATERIALS)
-                elif world_y < terrain_height + self.settings.grass_layer_thickness:
-                    # Just below grass is thin top soil
-                    material = MaterialType.DIRT_LIGHT
-                elif world_y < terrain_height + self.settings.dirt_layer_thickness:
-                    # Thick dirt layer
-                    material = random.choice(DIRT_MATERIALS)
-                elif world_y < terrain_height + self.settings.stone_transition_depth:
-                    # Upper stone layer
-                    material = random.choice(STONE_MATERIALS)
+            # The chunk may have been generated synchronously in the meantime
+            chunk = self.chunks.get(chunk_key)
+            if chunk is None:
+                if future.cancelled() or error is not None:
+                    if error is not None:
+                        print(f"Error generating chunk {chunk_x}, {chunk_y}: {error}")
+                    # Fall back to generating the chunk here rather than leaving a hole
+                    chunk = self.generate_chunk(chunk_x, chunk_y)
                 else:
-                    # Deep stone layer
-                    material = random.choice(DEEP_STONE_MATERIALS)
-                
-                # Set the block in the chunk
-                chunk.set_block(local_x, local_y, material)
-        
-        return chunk
+                    blocks = future.result()
+                    chunk = self._new_chunk(chunk_x, chunk_y)
+                    chunk.blocks[:, :] = blocks
+                    
+                    if self.chunk_cache is not None:
+                        self.chunk_cache.store(self._cache_generation, chunk_x, chunk_y, blocks)
+                installed += 1
+            
+            self._activate_if_wanted(chunk_key, chunk)
+        return installed
+    
+    def shutdown(self) -> None:
+        """Stop the chunk worker pool and flush the chunk cache"""
+        if self._chunk_executor is not None:
+            # Cancel queued chunks by hand - shutdown(cancel_futures=True) needs Python 3.9
+            for _, _, future in self._pending_chunks.values():
+                future.cancel()
+            self._chunk_executor.shutdown(wait=False)
+            self._chunk_executor = None
+        self._pending_chunks.clear()
+        
+        if self.chunk_cache is not None:
+            self.chunk_cache.close()
+            self.chunk_cache = None
     
     def generate_initial_chunks(self, radius: int = ACTIVE_CHUNKS_RADIUS):
-        """Generate initial chunks around spawn point"""
+        """Generate initial chunks around the spawn point
+        
+        Generation and the loading screen preview share a single pass: each
+        chunk is downsampled into the preview arrays as soon as it is generated.
+        """
         # Use smaller radius for initial chunks - improves loading time
         initial_radius = min(5, radius) 
         
-        # Generate chunks in a circle around (0,0) for more efficiency
-        for chunk_x in range(-initial_radius, initial_radius + 1):
-            for chunk_y in range(-initial_radius, initial_radius + 1):
-                # Only generate chunks in a circular pattern
-                if chunk_x*chunk_x + chunk_y*chunk_y <= initial_radius*initial_radius:
-                    self.get_chunk(chunk_x, chunk_y)
-                    
-                    # Update loading progress incrementally
-                    total_chunks = (2*initial_radius+1)**2
-                    current_chunk = (chunk_x + initial_radius) * (2*initial_radius+1) + (chunk_y + initial_radius)
-                    self.loading_progress = 0.1 + (current_chunk / total_chunks * 0.7)
+        # Generate chunks in a circle around the spawn chunk, nearest first so
+        # the preview fills in from the center
+        center_chunk_x, center_chunk_y = self.world_to_chunk_coords(*self.spawn_position)
+        chunks_to_process = (_circle_offsets(initial_radius) + (center_chunk_x, center_chunk_y)).tolist()
+        total_chunks = len(chunks_to_process)
+        
+        # Preallocate the preview arrays for every chunk up front
+        preview_size = CHUNK_SIZE // PREVIEW_STEP
+        preview_slice = slice(PREVIEW_OFFSET, None, PREVIEW_STEP)
+        self.preview_cxs = np.empty(total_chunks, dtype=np.int32)
+        self.preview_cys = np.empty(total_chunks, dtype=np.int32)
+        self.preview_tiles = np.zeros((total_chunks, preview_size, preview_size), dtype=np.uint8)
+        self.preview_count = 0
+        
+        for index, (chunk_x, chunk_y) in enumerate(chunks_to_process):
+            chunk = self.get_chunk(chunk_x, chunk_y)
+            
+            # Sample the finished chunk for the loading screen preview
+            preview_data = chunk.blocks[preview_slice, preview_slice]
+            self.preview_cxs[index] = chunk_x
+            self.preview_cys[index] = chunk_y
+            self.preview_tiles[index] = preview_data
+            self.preview_count = index + 1
+            
+            # Update loading progress incrementally
+            self.loading_progress = 0.1 + ((index + 1) / total_chunks * 0.7)
         
         # Find a suitable spawn point
         self.find_spawn_point()
     
+    def start_preload(self, radius: int = ACTIVE_CHUNKS_RADIUS) -> None:
+        """Run generate_initial_chunks on a background thread
+        
+        The loading screen keeps rendering while the preview arrays and
+        loading_progress fill in. Call wait_for_preload() before touching the
+        world's chunks from the main thread.
+        """
+        self._preload_thread = threading.Thread(target=self._preload, args=(radius,), daemon=True)
+        self._preload_thread.start()
+    
+    def _preload(self, radius: int) -> None:
+        """Background thread body for start_preload"""
+        try:
+            self.generate_initial_chunks(radius)
+        except Exception as e:
+            print(f"Error preloading chunks: {e}")
+        
+        self.loading_progress = 1.0
+        self.preloaded = True
+    
+    def wait_for_preload(self) -> None:
+        """Block until a preload started with start_preload has finished"""
+        if self._preload_thread is not None:
+            self._preload_thread.join()
+            self._preload_thread = None
+    
     def find_spawn_point(self):
         """Find a suitable spawn point on the surface"""
-        # Start at x=0 and find the terrain height
-        spawn_x = 0
+        # Keep the spawn column and find the terrain height there
+        spawn_x = self.spawn_position[0]
         spawn_y = self.get_terrain_height(spawn_x) - 3  # Position player above ground
         
         # Save the spawn position
@@ -282,16 +798,14 @@ class World:
         
     def get_sky_color(self, biome: BiomeType) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
         """Get sky color for a biome"""
-        if biome in BIOME_SKY_COLORS:
-            return (BIOME_SKY_COLORS[biome]['top'], BIOME_SKY_COLORS[biome]['horizon'])
-        else:
-            # Default sky colors if biome not found
-            return ((92, 148, 252), (210, 230, 255))
+        # Default sky colors if biome not found
+        return _SKY_COLORS.get(biome, _SKY_FALLBACK)
             
     def get_active_chunks(self) -> List[Chunk]:
-        """Get list of active chunks"""
-        active_chunks = []
-        for coord in self.active_chunks:
-            if coord in self.chunks:
-                active_chunks.append(self.chunks[coord])
-        return active_chunks
\ No newline at end of file
+        """Get list of active chunks that have been generated
+        
+        The list is built by update_active_chunks(), nearest to the player
+        first, and extended by poll_chunk_requests() as queued chunks arrive.
+        It is shared between calls, so callers must not modify it.
+        """
+        return self._active_chunk_list
\ No newline at end of file
@@ -7,6 +7,5 @@ setup(
     install_requires=[
         "pygame>=2.0.0",
         "numpy>=1.20.0",
-        "noise>=1.2.2",  # For Perlin noise in procedural generation
     ],
 )
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Tests for the on-disk chunk cache
+"""
+import numpy as np
+
+from eartheater.chunk_cache import WorldCache, generation_id
+from eartheater.constants import CHUNK_SIZE, MaterialType, WorldGenSettings
+from eartheater.world import World
+
+
+def _cached_settings(tmp_path):
+    """World generation settings with a fixed seed and the cache enabled"""
+    settings = WorldGenSettings()
+    settings.seed = 1234
+    settings.chunk_cache_dir = str(tmp_path)
+    return settings
+
+
+def test_cache_round_trip(tmp_path):
+    """Test that stored blocks are read back unchanged after reopening"""
+    blocks = np.random.randint(0, 20, size=(CHUNK_SIZE, CHUNK_SIZE)).astype(np.uint8)
+    
+    cache = WorldCache(str(tmp_path))
+    cache.store("gen-a", 3, -2, blocks)
+    cache.close()
+    
+    cache = WorldCache(str(tmp_path))
+    assert np.array_equal(cache.load("gen-a", 3, -2), blocks)
+    assert cache.load("gen-b", 3, -2) is None
+    assert cache.load("gen-a", 3, -1) is None
+    cache.close()
+
+
+def test_generation_id_tracks_terrain_settings(tmp_path):
+    """Test that settings which change the terrain change the generation id"""
+    settings = _cached_settings(tmp_path)
+    base = generation_id(settings)
+    
+    # The cache location doesn't affect the terrain
+    settings.chunk_cache_dir = str(tmp_path / "elsewhere")
+    assert generation_id(settings) == base
+    
+    settings.terrain_roughness += 0.1
+    assert generation_id(settings) != base
+    
+    settings = _cached_settings(tmp_path)
+    settings.dirt_layer_thickness += 1
+    assert generation_id(settings) != base
+    
+    settings = _cached_settings(tmp_path)
+    settings.seed += 1
+    assert generation_id(settings) != base
+
+
+def test_world_loads_cached_chunks(tmp_path):
+    """Test that a world loads chunks from the cache instead of generating them"""
+    settings = _cached_settings(tmp_path)
+    
+    # Blocks generation could never produce
+    sentinel = np.full((CHUNK_SIZE, CHUNK_SIZE), MaterialType.LAVA.value, dtype=np.uint8)
+    cache = WorldCache(settings.chunk_cache_dir)
+    cache.store(generation_id(settings), 0, 1, sentinel)
+    cache.close()
+    
+    world = World(settings)
+    assert np.array_equal(world.get_chunk(0, 1).blocks, sentinel)
+    world.shutdown()
+    
+    # Entries from other settings are ignored
+    settings.terrain_roughness += 0.1
+    world = World(settings)
+    assert not np.array_equal(world.get_chunk(0, 1).blocks, sentinel)
+    world.shutdown()
+
+
+def test_world_stores_generated_chunks(tmp_path):
+    """Test that generated chunks are written to the cache"""
+    settings = _cached_settings(tmp_path)
+    
+    world = World(settings)
+    generated = world.get_chunk(0, 1).blocks.copy()
+    world.shutdown()
+    
+    cache = WorldCache(settings.chunk_cache_dir)
+    assert np.array_equal(cache.load(generation_id(settings), 0, 1), generated)
+    cache.close()
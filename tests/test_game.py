@@ -0,0 +1,28 @@
+"""
+Tests for the game module
+"""
+
+import pytest
+
+
+@pytest.fixture
+def headless(monkeypatch):
+    """Run pygame without a window or audio device"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+
+
+def test_quit_from_menu(headless):
+    """Test that quitting before a game was started shuts down cleanly"""
+    import pygame
+    from eartheater.game import Game, GameState
+    
+    game = Game()
+    assert game.state == GameState.MENU
+    assert game.world is None
+    
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    game.run()
+    
+    assert not game.running
+    assert not pygame.get_init()  # The renderer was cleaned up
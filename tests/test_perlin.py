@@ -0,0 +1,46 @@
+"""
+Tests for the perlin noise module
+"""
+import pytest
+import numpy as np
+
+from eartheater.perlin import perlin1d, perlin1d_channels
+
+
+def test_perlin1d_shape_and_range():
+    """Test that batched noise keeps the input shape and stays in range"""
+    xs = np.linspace(-500, 500, 2001)
+    values = perlin1d(xs, octaves=2)
+    
+    assert values.shape == xs.shape
+    assert np.all(np.abs(values) <= 1.0)
+
+
+def test_perlin1d_integer_lattice_is_zero():
+    """Test that gradient noise is zero at integer coordinates"""
+    values = perlin1d(np.arange(-10, 10), base=7)
+    assert np.all(values == 0)
+
+
+def test_perlin1d_base_changes_noise():
+    """Test that different bases produce different noise"""
+    xs = np.arange(100) * 0.37
+    assert not np.array_equal(perlin1d(xs, base=1), perlin1d(xs, base=2))
+    
+    # Same base should be deterministic
+    assert np.array_equal(perlin1d(xs, base=3), perlin1d(xs, base=3))
+
+
+def test_perlin1d_rejects_zero_octaves():
+    """Test that invalid octave counts raise an error"""
+    with pytest.raises(ValueError):
+        perlin1d([0.5], octaves=0)
+
+
+def test_perlin1d_channels_match_perlin1d():
+    """Test that fused channels match sampling each channel separately"""
+    xs = np.arange(-300, 300)
+    large, detail = perlin1d_channels(xs, [(0.01, 1, 5), (0.05, 2, 6)])
+    
+    assert np.array_equal(large, perlin1d(xs * 0.01, octaves=1, base=5))
+    assert np.array_equal(detail, perlin1d(xs * 0.05, octaves=2, base=6))
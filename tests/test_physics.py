@@ -21,21 +21,21 @@ def test_physics_falling_materials():
     world = World()
     physics = PhysicsEngine(world)
     
-    # Create a sand block floating in air
-    x, y = 10, 10
-    world.set_tile(x, y, MaterialType.SAND)
+    # Create a water block floating in the sky
+    x, y = 8, 10
+    world.set_block(x, y, MaterialType.WATER)
     
     # Make sure blocks below are air
     for i in range(1, 4):
-        world.set_tile(x, y + i, MaterialType.AIR)
+        world.set_block(x, y + i, MaterialType.AIR)
     
-    # Run physics for a few steps
-    for _ in range(3):
-        physics.update()
+    # Run physics for a couple of steps near the water
+    physics.update(x, y)
+    physics.update(x, y)
     
-    # The sand should have moved down
-    assert world.get_tile(x, y) == MaterialType.AIR
-    assert world.get_tile(x, y + 1) == MaterialType.SAND or world.get_tile(x, y + 2) == MaterialType.SAND or world.get_tile(x, y + 3) == MaterialType.SAND
+    # The water should have moved down
+    assert world.get_block(x, y) == MaterialType.AIR
+    assert world.get_block(x, y + 1) == MaterialType.WATER
 
 
 def test_physics_blocked_materials():
@@ -44,19 +44,21 @@ def test_physics_blocked_materials():
     physics = PhysicsEngine(world)
     
     # Create a sand block
-    x, y = 10, 10
-    world.set_tile(x, y, MaterialType.SAND)
+    x, y = 8, 10
+    world.set_block(x, y, MaterialType.SAND_LIGHT)
     
-    # Create a solid block below
-    world.set_tile(x, y + 1, MaterialType.STONE)
+    # Create a solid block below, and walls so it can't slide off
+    world.set_block(x, y + 1, MaterialType.STONE_MEDIUM)
+    world.set_block(x - 1, y + 1, MaterialType.STONE_MEDIUM)
+    world.set_block(x + 1, y + 1, MaterialType.STONE_MEDIUM)
     
     # Run physics for a few steps
-    for _ in range(3):
-        physics.update()
+    for _ in range(100):
+        physics.update(x, y)
     
     # The sand should not have moved
-    assert world.get_tile(x, y) == MaterialType.SAND
-    assert world.get_tile(x, y + 1) == MaterialType.STONE
+    assert world.get_block(x, y) == MaterialType.SAND_LIGHT
+    assert world.get_block(x, y + 1) == MaterialType.STONE_MEDIUM
 
 
 def test_physics_collision_detection():
@@ -65,21 +67,23 @@ def test_physics_collision_detection():
     physics = PhysicsEngine(world)
     
     # Create an empty area
-    for x in range(5, 15):
-        for y in range(5, 15):
-            world.set_tile(x, y, MaterialType.AIR)
+    for x in range(5, 25):
+        for y in range(5, 25):
+            world.set_block(x, y, MaterialType.AIR)
     
     # No collision in empty space
-    assert not physics.check_collision(10, 10, 2, 2)
+    assert not physics.check_collision(10, 10, 4, 4)
     
-    # Create a block
-    world.set_tile(11, 11, MaterialType.STONE)
+    # Fill the area with solid blocks
+    for x in range(10, 15):
+        for y in range(10, 15):
+            world.set_block(x, y, MaterialType.STONE_MEDIUM)
     
     # Should collide now
-    assert physics.check_collision(10, 10, 2, 2)
+    assert physics.check_collision(10, 10, 4, 4)
     
     # No collision if we're not overlapping
-    assert not physics.check_collision(8, 8, 2, 2)
+    assert not physics.check_collision(18, 18, 4, 4)
 
 
 def test_physics_dig():
@@ -90,17 +94,17 @@ def test_physics_dig():
     # Create a solid area
     for x in range(8, 13):
         for y in range(8, 13):
-            world.set_tile(x, y, MaterialType.STONE)
+            world.set_block(x, y, MaterialType.STONE_MEDIUM)
     
     # Dig at the center
     physics.dig(10, 10, 1)
     
-    # Check that the center and adjacent tiles are now air
-    assert world.get_tile(10, 10) == MaterialType.AIR
-    assert world.get_tile(9, 10) == MaterialType.AIR
-    assert world.get_tile(11, 10) == MaterialType.AIR
-    assert world.get_tile(10, 9) == MaterialType.AIR
-    assert world.get_tile(10, 11) == MaterialType.AIR
+    # Check that the center and adjacent blocks are now air
+    assert world.get_block(10, 10) == MaterialType.AIR
+    assert world.get_block(9, 10) == MaterialType.AIR
+    assert world.get_block(11, 10) == MaterialType.AIR
+    assert world.get_block(10, 9) == MaterialType.AIR
+    assert world.get_block(10, 11) == MaterialType.AIR
     
     # Diagonal corners should still be stone (radius=1)
-    assert world.get_tile(9, 9) == MaterialType.STONE
\ No newline at end of file
+    assert world.get_block(9, 9) == MaterialType.STONE_MEDIUM
@@ -1,11 +1,18 @@
 """
 Tests for the world module
 """
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
 import pytest
 import numpy as np
 
-from eartheater.world import World, Chunk
-from eartheater.constants import MaterialType, CHUNK_SIZE
+from eartheater.world import (
+    World, Chunk, BLOCK_SLAB_INITIAL_SLOTS, TERRAIN_HEIGHT_CACHE_LIMIT, SYNC_CHUNKS_X, SYNC_CHUNKS_Y,
+    _chunk_rng, _terrain_heights, generate_chunk_blocks
+)
+from eartheater.constants import MaterialType, CHUNK_SIZE, WorldGenSettings
 
 
 def test_chunk_creation():
@@ -13,33 +20,41 @@ def test_chunk_creation():
     chunk = Chunk(0, 0)
     assert chunk.x == 0
     assert chunk.y == 0
-    assert chunk.tiles.shape == (CHUNK_SIZE, CHUNK_SIZE)
-    assert chunk.needs_update is True
+    assert chunk.blocks.shape == (CHUNK_SIZE, CHUNK_SIZE)
+    assert chunk.blocks.dtype == np.uint8
+    assert chunk.needs_render_update is True
+    assert chunk.dirty_rows == 0
+    assert chunk.is_empty()
 
 
-def test_chunk_set_get_tile():
-    """Test setting and getting tiles in a chunk"""
+def test_chunk_set_get_block():
+    """Test setting and getting blocks in a chunk"""
     chunk = Chunk(0, 0)
     
-    # Initially all tiles should be air
-    assert chunk.get_tile(0, 0) == MaterialType.AIR
+    # Initially all blocks should be air
+    assert chunk.get_block(0, 0) == MaterialType.AIR
+    
+    # Set and check a block
+    assert chunk.set_block(5, 7, MaterialType.DIRT_MEDIUM)
+    assert chunk.get_block(5, 7) == MaterialType.DIRT_MEDIUM
+    assert chunk.dirty_rows == 1 << 7
     
-    # Set and check a tile
-    chunk.set_tile(5, 7, MaterialType.DIRT)
-    assert chunk.get_tile(5, 7) == MaterialType.DIRT
-    assert chunk.needs_update is True
+    # Set another block
+    chunk.set_block(10, 8, MaterialType.STONE_MEDIUM)
+    assert chunk.get_block(10, 8) == MaterialType.STONE_MEDIUM
+    assert chunk.dirty_rows == (1 << 7) | (1 << 8)
     
-    # Set another tile
-    chunk.set_tile(10, 8, MaterialType.STONE)
-    assert chunk.get_tile(10, 8) == MaterialType.STONE
+    # Out of bounds reads are void and writes are rejected
+    assert chunk.get_block(-1, 0) == MaterialType.VOID
+    assert not chunk.set_block(CHUNK_SIZE, 0, MaterialType.DIRT_MEDIUM)
 
 
 def test_world_creation():
-    """Test that a world can be created and has the expected chunks"""
+    """Test that a world generates chunks on demand"""
     world = World()
     
-    # Check that chunks exist
-    assert len(world.chunks) > 0
+    # Chunks are only generated when requested
+    assert len(world.chunks) == 0
     
     # Test getting a chunk
     first_chunk = world.get_chunk(0, 0)
@@ -47,35 +62,297 @@ def test_world_creation():
     assert isinstance(first_chunk, Chunk)
     assert first_chunk.x == 0
     assert first_chunk.y == 0
+    assert len(world.chunks) == 1
+    
+    # Requesting it again returns the same chunk
+    assert world.get_chunk(0, 0) is first_chunk
+
+
+def test_world_get_set_block():
+    """Test setting and getting blocks in the world"""
+    world = World()
+    
+    # Set and check a block
+    world.set_block(5, 7, MaterialType.DIRT_MEDIUM)
+    assert world.get_block(5, 7) == MaterialType.DIRT_MEDIUM
+    
+    # Set another block
+    world.set_block(20, 15, MaterialType.STONE_MEDIUM)
+    assert world.get_block(20, 15) == MaterialType.STONE_MEDIUM
+    
+    # Negative coordinates land in neighbouring chunks
+    world.set_block(-1, -1, MaterialType.DIRT_MEDIUM)
+    assert world.get_block(-1, -1) == MaterialType.DIRT_MEDIUM
+    assert world.get_chunk(-1, -1).get_block(CHUNK_SIZE - 1, CHUNK_SIZE - 1) == MaterialType.DIRT_MEDIUM
+
+
+def test_world_generates_chunks_into_block_slab():
+    """Test that generated chunks are filled in place in their own slab slot"""
+    world = World()
+    first = world.generate_chunk(2, 2)
+    
+    assert world.chunks[(2, 2)] is first
+    assert np.shares_memory(first.blocks, world._block_slab)
+    
+    # Generating a loaded chunk again doesn't touch the loaded one
+    blocks = first.blocks.copy()
+    second = world.generate_chunk(2, 2)
+    assert world.chunks[(2, 2)] is first
+    assert not np.shares_memory(second.blocks, first.blocks)
+    assert np.array_equal(first.blocks, blocks)
+    assert np.array_equal(second.blocks, blocks)
+
+
+def test_world_block_slab_growth():
+    """Test that loaded chunks keep their blocks when the block slab grows"""
+    world = World()
+    coords = [(x, 2) for x in range(BLOCK_SLAB_INITIAL_SLOTS + 5)]
+    
+    # Mark each chunk so moved storage can be checked
+    for index, (chunk_x, chunk_y) in enumerate(coords):
+        world.get_chunk(chunk_x, chunk_y).blocks[0, 0] = index % 250
+    
+    assert len(world._block_slab) > BLOCK_SLAB_INITIAL_SLOTS
+    for index, (chunk_x, chunk_y) in enumerate(coords):
+        chunk = world.get_chunk(chunk_x, chunk_y)
+        assert chunk.blocks[0, 0] == index % 250
+        assert np.shares_memory(chunk.blocks, world._block_slab)
+    
+    # Every chunk has a slot of its own
+    assert len(set(world._chunk_slots.values())) == len(coords)
+
+
+def _expected_heights(world, x_start, count):
+    """Terrain heights computed directly, bypassing the world's cache"""
+    return _terrain_heights(np.arange(x_start, x_start + count), world._seed_base,
+                            world._seed_detail, world.terrain_amplitude)
+
+
+def test_terrain_height_cache_negative_x():
+    """Test cached terrain heights left of the origin"""
+    world = World()
+    
+    assert world.get_terrain_height(-500) == _expected_heights(world, -500, 1)[0]
+    assert np.array_equal(world.get_terrain_heights(-1000, 100), _expected_heights(world, -1000, 100))
+    assert world._height_cache_origin <= -1000
+
+
+def test_terrain_height_cache_grows_both_ways():
+    """Test that the cache window grows in both directions and keeps cached columns"""
+    world = World()
+    world.get_terrain_heights(0, 64)
+    first_origin = world._height_cache_origin
+    first_end = first_origin + len(world.terrain_height_cache)
+    
+    # Grow to the left, then to the right
+    assert np.array_equal(world.get_terrain_heights(first_origin - 300, 10),
+                          _expected_heights(world, first_origin - 300, 10))
+    assert world._height_cache_origin <= first_origin - 300
+    assert np.array_equal(world.get_terrain_heights(first_end + 300, 10),
+                          _expected_heights(world, first_end + 300, 10))
+    assert world._height_cache_origin + len(world.terrain_height_cache) >= first_end + 310
+    
+    # Everything in the window is either unset or correct
+    origin = world._height_cache_origin
+    cache = world.terrain_height_cache
+    computed = cache != np.iinfo(np.int32).min
+    expected = _expected_heights(world, origin, len(cache))
+    assert computed.sum() >= 64 + 10 + 10
+    assert np.array_equal(cache[computed], expected[computed])
+    assert np.array_equal(world.get_terrain_heights(0, 64), _expected_heights(world, 0, 64))
+
+
+def test_terrain_height_cache_resets_past_limit():
+    """Test that the cache starts a new window rather than growing past its limit"""
+    world = World()
+    world.get_terrain_heights(0, 64)
+    
+    far_x = TERRAIN_HEIGHT_CACHE_LIMIT * 3
+    assert world.get_terrain_height(far_x) == _expected_heights(world, far_x, 1)[0]
+    assert len(world.terrain_height_cache) <= TERRAIN_HEIGHT_CACHE_LIMIT
+    assert world._height_cache_origin <= far_x < world._height_cache_origin + len(world.terrain_height_cache)
+    
+    # Columns dropped from the window are recomputed correctly
+    assert np.array_equal(world.get_terrain_heights(-10, 64), _expected_heights(world, -10, 64))
+    assert len(world.terrain_height_cache) <= TERRAIN_HEIGHT_CACHE_LIMIT
 
 
-def test_world_get_set_tile():
-    """Test setting and getting tiles in the world"""
+def test_worker_generation_matches_world():
+    """Test that the worker pool entry point generates the same chunks as the world"""
+    settings = WorldGenSettings()
+    world = World(settings)
+    
+    for chunk_x, chunk_y in [(0, 1), (0, 2), (-3, 2), (7, 9)]:
+        assert np.array_equal(generate_chunk_blocks(chunk_x, chunk_y, settings),
+                              world.get_chunk(chunk_x, chunk_y).blocks)
+
+
+def test_world_generates_layers():
+    """Test that generated terrain has air above and deep stone far below the surface"""
     world = World()
+    height = world.get_terrain_height(0)
     
-    # Set and check a tile
-    world.set_tile(5, 7, MaterialType.DIRT)
-    assert world.get_tile(5, 7) == MaterialType.DIRT
+    assert world.get_block(0, height - 1) == MaterialType.AIR
+    assert world.get_block(0, height) != MaterialType.AIR
+    assert world.get_block(0, height + 500) in (
+        MaterialType.DEEP_STONE_LIGHT, MaterialType.DEEP_STONE_MEDIUM, MaterialType.DEEP_STONE_DARK
+    )
+
+
+def test_chunk_rng_is_stable():
+    """Test that chunk variant rolls don't depend on Python's hash() or the process"""
+    # Pinned values, chunks must generate the same everywhere (and match the chunk cache)
+    assert _chunk_rng(1234, -3, 5).integers(0, 1 << 30, size=3).tolist() == [887409355, 1065726712, 1040734262]
+    assert _chunk_rng(1234, 3, 5).integers(0, 1 << 30, size=3).tolist() == [694932781, 638051244, 273845346]
+
+
+def test_world_preload_around_spawn():
+    """Test that the background preload generates the area the player spawns in"""
+    world = World()
+    spawn_x, spawn_y = world.spawn_position
+    spawn_chunk = world.world_to_chunk_coords(spawn_x, spawn_y)
     
-    # Set another tile
-    world.set_tile(20, 15, MaterialType.STONE)
-    assert world.get_tile(20, 15) == MaterialType.STONE
+    world.start_preload()
+    world.wait_for_preload()
     
-    # Check out of bounds
-    assert world.get_tile(-1, -1) == MaterialType.AIR
+    assert world.preloaded
+    assert world.loading_progress == 1.0
+    assert world.preview_count == len(world.chunks) > 0
     
-    # Setting out of bounds should not raise an error
-    world.set_tile(-1, -1, MaterialType.DIRT)
+    # The preview starts at the spawn chunk, and every chunk around it is loaded
+    assert (world.preview_cxs[0], world.preview_cys[0]) == spawn_chunk
+    for dx in range(-1, 2):
+        for dy in range(-1, 2):
+            assert (spawn_chunk[0] + dx, spawn_chunk[1] + dy) in world.chunks
+    
+    # The spawn point stays in the preloaded column, on top of the terrain
+    assert world.spawn_position == (spawn_x, world.get_terrain_height(spawn_x) - 3)
 
 
 def test_world_active_chunks():
     """Test getting active chunks"""
     world = World()
-    active_chunks = world.get_active_chunks()
+    try:
+        world.update_active_chunks(0, 0)
+        active_chunks = world.get_active_chunks()
+        
+        assert len(active_chunks) > 0
+        
+        # The chunk under the center comes first
+        assert (active_chunks[0].x, active_chunks[0].y) == world.world_to_chunk_coords(0, 0)
+        
+        # All active chunks should be instances of Chunk
+        for chunk in active_chunks:
+            assert isinstance(chunk, Chunk)
+            assert chunk.active
+    finally:
+        world.shutdown()
+
+
+def test_world_active_chunks_generate_async():
+    """Test that active chunks away from the center arrive from the worker pool"""
+    world = World()
+    try:
+        world.update_active_chunks(0, 0)
+        
+        # Only the chunks on screen are generated right away
+        assert len(world.get_active_chunks()) < len(world.active_chunks)
+        center_x, center_y = world.world_to_chunk_coords(0, 0)
+        for dx in range(-SYNC_CHUNKS_X, SYNC_CHUNKS_X + 1):
+            for dy in range(-SYNC_CHUNKS_Y, SYNC_CHUNKS_Y + 1):
+                chunk_key = (center_x + dx, center_y + dy)
+                if chunk_key in world.active_chunks:
+                    assert world.chunks[chunk_key].active
+        
+        deadline = time.monotonic() + 60
+        while len(world.get_active_chunks()) < len(world.active_chunks) and time.monotonic() < deadline:
+            world.poll_chunk_requests()
+            time.sleep(0.01)
+        
+        active_chunks = world.get_active_chunks()
+        assert len(active_chunks) == len(world.active_chunks)
+        assert all(chunk.active for chunk in active_chunks)
+    finally:
+        world.shutdown()
+
+
+def test_world_active_chunks_rerequested():
+    """Test that missing active chunks are requested again while the center is unchanged"""
+    world = World()
+    try:
+        world.update_active_chunks(0, 0)
+        missing = [key for key in world.active_chunks if key not in world.chunks]
+        assert missing
+        
+        # Lose every outstanding request
+        for chunk_key in missing:
+            del world._pending_chunks[chunk_key]
+        
+        world.update_active_chunks(0, 0)
+        assert all(key in world._pending_chunks or key in world.chunks for key in missing)
+    finally:
+        world.shutdown()
+
+
+class _BrokenExecutor:
+    """Stands in for a worker pool that lost a worker process"""
+    def __init__(self):
+        self.shut_down = False
+    
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("A worker process terminated abruptly")
+    
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+
+def test_world_request_chunk_with_broken_pool():
+    """Test that a broken worker pool is dropped and the chunk generated directly"""
+    settings = WorldGenSettings()
+    world = World(settings)
+    executor = world._chunk_executor = _BrokenExecutor()
+    
+    world.request_chunk_async(3, 2)
     
-    # All chunks should be active
-    assert len(active_chunks) == len(world.chunks)
+    assert executor.shut_down
+    assert world._chunk_executor is None
+    assert np.array_equal(world.chunks[(3, 2)].blocks, World(settings).get_chunk(3, 2).blocks)
+
+
+def test_world_poll_failed_chunk_requests():
+    """Test that chunks lost with a broken pool are generated on the main thread"""
+    settings = WorldGenSettings()
+    world = World(settings)
+    world.update_active_chunks(0, 0)
+    
+    # Pretend an active chunk's worker died while other requests were still queued
+    missing = [key for key in world.active_chunks if key not in world.chunks]
+    world.shutdown()
+    broken = Future()
+    broken.set_exception(BrokenProcessPool("A worker process terminated abruptly"))
+    world._pending_chunks[missing[0]] = missing[0] + (broken,)
+    for chunk_key in missing[1:3]:
+        world._pending_chunks[chunk_key] = chunk_key + (Future(),)
+    
+    # All of them are generated right away and nothing is left pending
+    assert world.poll_chunk_requests() == 3
+    assert not world._pending_chunks
+    
+    reference = World(settings)
+    for chunk_key in missing[:3]:
+        chunk = world.chunks[chunk_key]
+        assert chunk.active
+        assert chunk in world.get_active_chunks()
+        assert np.array_equal(chunk.blocks, reference.get_chunk(*chunk_key).blocks)
+
+
+def test_world_poll_cancelled_chunk_request():
+    """Test that a cancelled request is generated on the main thread instead"""
+    world = World()
+    future = Future()
+    assert future.cancel()
+    world._pending_chunks[(4, 2)] = (4, 2, future)
     
-    # All chunks should be instances of Chunk
-    for chunk in active_chunks:
-        assert isinstance(chunk, Chunk)
\ No newline at end of file
+    assert world.poll_chunk_requests() == 1
+    assert (4, 2) in world.chunks
+    assert not world._pending_chunks